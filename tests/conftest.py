@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import os
+from importlib import import_module
+from pathlib import Path
+from subprocess import CompletedProcess
+from typing import Dict, List
+
+from pytest import Config, Session, fixture
+from typer.testing import CliRunner
+
+TEST_ENV = {
+    'DOTFILES_REPO': 'TEST_DOTFILES_REPO',
+    'TYPER_SCRIPTS_REPOS': '~/repo1 ~/repo2',
+}
+WARM_MODULES = ('typer_scripts.core', 'typer_scripts.repos')
+_saved_env: Dict[str, str] = {}
+
+
+def pytest_configure(config: Config) -> None:
+    for module in WARM_MODULES:
+        import_module(module)
+
+
+def pytest_sessionstart(session: Session) -> None:
+    for name in TEST_ENV:
+        if name in os.environ:
+            _saved_env[name] = os.environ[name]
+    os.environ.update(TEST_ENV)
+
+
+def pytest_sessionfinish(session: Session, exitstatus: int) -> None:
+    for name in TEST_ENV:
+        os.environ.pop(name, None)
+    os.environ.update(_saved_env)
+
+
+@fixture(scope='session')
+def cli_runner() -> CliRunner:
+    return CliRunner(mix_stderr=False)
+
+
+@fixture(scope='session')
+def repo1() -> Path:
+    return Path('~/repo1')
+
+
+@fixture(scope='session')
+def repos(repo1: Path) -> List[Path]:
+    return [repo1, Path('~/repo2')]
+
+
+@fixture(scope='session')
+def clean_output() -> CompletedProcess[bytes]:
+    return CompletedProcess([], 0, b'')
+
+
+@fixture(scope='session')
+def unsaved_changes_output() -> CompletedProcess[bytes]:
+    return CompletedProcess([], 0, b' M file\n')
+
+
+@fixture(scope='session')
+def staged_changes_output() -> CompletedProcess[bytes]:
+    return CompletedProcess([], 0, b'M  file\n')
+
+
+@fixture(scope='session')
+def untracked_files_output() -> CompletedProcess[bytes]:
+    return CompletedProcess([], 0, b'?? new-file\n')
+
+
+@fixture(scope='session')
+def unpushed_commits_output() -> CompletedProcess[bytes]:
+    return CompletedProcess([], 0, b'0123abc\n')
@@ -1,29 +1,56 @@
 #!/usr/bin/env python3
-from subprocess import CalledProcessError
-from pytest import CaptureFixture, raises
+from shutil import which
+from subprocess import DEVNULL, PIPE, CalledProcessError, CompletedProcess
+from typing import Any, Dict
+from unittest.mock import Mock
 
-from typer_scripts.core import run, RunMode
+from pytest import CaptureFixture, MonkeyPatch, fixture, mark, raises
+
+from typer import style
+
+from typer_scripts.core import info, run, title, RunMode
+
+SPAWN_KWARGS = {'executable': which('echo'), 'close_fds': False}
+
+
+@fixture
+def subprocess_run(monkeypatch: MonkeyPatch) -> Mock:
+    subprocess_run_mock = Mock(return_value=CompletedProcess(
+        ('echo', 'value'), 0, b'value\n', b''))
+    monkeypatch.setattr('typer_scripts.core.subprocess.run',
+                        subprocess_run_mock)
+    return subprocess_run_mock
 
 
 class TestRun:
     @staticmethod
+    @mark.slow
     def test_run_executes_command(capfd: CaptureFixture[str]) -> None:
         run(['echo', 'value'], RunMode.DEFAULT)
 
         assert 'value' in capfd.readouterr().out
 
     @staticmethod
-    def test_run_captures_output(capfd: CaptureFixture[str]) -> None:
+    @mark.parametrize(('capture_output', 'subprocess_kwargs'), [
+        (False, SPAWN_KWARGS),
+        (True, {'stdout': PIPE, 'stderr': DEVNULL, **SPAWN_KWARGS}),
+    ])
+    def test_run_calls_subprocess(subprocess_run: Mock, capture_output: bool,
+                                  subprocess_kwargs: Dict[str, Any]) -> None:
         result = run(['echo', 'value'], RunMode.DEFAULT,
-                     capture_output=True)
+                     capture_output=capture_output)
 
-        assert 'value' in result.stdout.decode()
+        subprocess_run.assert_called_once_with(
+            ['echo', 'value'], check=True, **subprocess_kwargs)
+        assert result is subprocess_run.return_value
 
     @staticmethod
-    def test_run_prints_args_with_dry_run(capfd: CaptureFixture[str]) -> None:
+    def test_run_prints_args_with_dry_run(
+            capsys: CaptureFixture[str],
+    ) -> None:
         run(['echo', 'value'], RunMode.DRY_RUN)
 
-        assert "('echo', 'value')" in capfd.readouterr().out
+        assert "('echo', 'value')" in capsys.readouterr().out
 
     @staticmethod
     def test_run_returns_expected_completed_process_with_dry_run() -> None:
@@ -35,7 +62,46 @@ class TestRun:
 
     @staticmethod
     def test_run_raises_exception_with_invalid_command(
-            capfd: CaptureFixture[str],
+            subprocess_run: Mock,
     ) -> None:
+        subprocess_run.side_effect = CalledProcessError(
+            2, ('ls', '--unknown-flag'))
+
         with raises(CalledProcessError):
             run(['ls', '--unknown-flag'], RunMode.DEFAULT)
+
+
+class TestOutput:
+    @staticmethod
+    def test_info_is_styled_on_a_terminal(
+            capsys: CaptureFixture[str], monkeypatch: MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr('sys.stdout.isatty', lambda: True)
+
+        info('message')
+
+        assert capsys.readouterr().out == f"{style('message', 'cyan')}\n"
+
+    @staticmethod
+    def test_info_is_plain_when_not_a_terminal(
+            capsys: CaptureFixture[str],
+    ) -> None:
+        info('message')
+
+        assert capsys.readouterr().out == 'message\n'
+
+    @staticmethod
+    def test_title_is_plain_when_not_a_terminal(
+            capsys: CaptureFixture[str],
+    ) -> None:
+        title('Title')
+
+        assert capsys.readouterr().out == '\nTitle...\n'
+
+    @staticmethod
+    def test_info_does_not_fail_without_stdout(
+            monkeypatch: MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr('sys.stdout', None)
+
+        info('message')
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
+import re
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
-from typing import List, Union, Iterable, Tuple, Any
-from unittest.mock import Mock, call, patch
+from typing import Dict, List, Pattern, Union, Iterable, Tuple, Any
+from unittest.mock import Mock, _Call, call, patch
 
-from pytest import CaptureFixture, fixture, raises, mark, MonkeyPatch
-from typer.testing import CliRunner
+from pytest import (CaptureFixture, FixtureRequest, fixture, raises, mark,
+                    MonkeyPatch)
+from typer.testing import CliRunner, Result
 
 from typer_scripts.core import RunMode
 from typer_scripts.repos import (check_repos_clean, check_dotfiles_clean,
@@ -15,6 +21,38 @@ DARWIN = 'Darwin'
 LINUX = 'Linux'
 UNKNOWN_OS = 'Unknown OS'
 
+HOME = Path.home()
+
+DOTFILES_PREFIX = ('git', '--git-dir=TEST_DOTFILES_REPO')
+DOTFILES_CHECK_PREFIX = (*DOTFILES_PREFIX, '--no-optional-locks')
+FETCH_DOTFILES_ARGS = [*DOTFILES_PREFIX, 'fetch']
+UNSAVED_CHANGES_SUFFIX = ('status', '--porcelain', '--ignore-submodules')
+UNPUSHED_COMMITS_SUFFIX = ('rev-list', '-1', '--branches', '--not',
+                           '--remotes')
+DOTFILES_CHECK_CALLS = [
+    call([*DOTFILES_CHECK_PREFIX, *UNSAVED_CHANGES_SUFFIX], RunMode.DEFAULT,
+         capture_output=True),
+    call([*DOTFILES_CHECK_PREFIX, *UNPUSHED_COMMITS_SUFFIX], RunMode.DEFAULT,
+         capture_output=True),
+]
+
+NOT_CLEAN_OUTPUTS = [
+    ['unsaved_changes_output'],
+    ['staged_changes_output'],
+    ['untracked_files_output'],
+    ['clean_output', 'unpushed_commits_output'],
+]
+NOT_CLEAN_OUTPUTS_IDS = ['unsaved', 'staged', 'untracked-files', 'unpushed']
+
+NO_REPOS_PATTERN = re.compile(
+    'Either the `repos` argument or the `TYPER_SCRIPTS_REPOS` env variable '
+    'must be provided'
+)
+NO_DOTFILES_PATTERN = re.compile(
+    'The `DOTFILES_REPO` env variable must be provided')
+NON_ZERO_EXIT_PATTERN = re.compile(
+    re.escape("Command 'command' returned non-zero exit status 1."))
+
 
 @fixture
 def run():
@@ -22,66 +60,57 @@ def run():
         yield run_mock
 
 
-@fixture
-def repo1() -> Path:
-    return Path('~/repo1')
-
-
-@fixture
-def repos(repo1: Path) -> List[Path]:
-    return [repo1, Path('~/repo2')]
-
-
-@fixture
-def clean_output() -> CompletedProcess[bytes]:
-    return CompletedProcess([], 0, b'  ')
-
+@fixture(scope='session')
+def expanded_repo1() -> Path:
+    return HOME / 'repo1'
 
-@fixture
-def unsaved_changes_output() -> CompletedProcess[bytes]:
-    return CompletedProcess([], 0, b'M  fake_file')
 
+@fixture(scope='session')
+def expanded_repos(expanded_repo1: Path) -> List[Path]:
+    return [expanded_repo1, HOME / 'repo2']
 
-@fixture
-def unpushed_commits_output() -> CompletedProcess[bytes]:
-    return CompletedProcess([], 0, b'a9a152e (HEAD -> main) Create fake '
-                            b'commit')
 
+@fixture(scope='session')
+def not_a_repo_pattern(expanded_repo1: Path) -> Pattern[str]:
+    escaped_repo = re.escape(str(expanded_repo1))
+    return re.compile(f'Not a git repository: {escaped_repo}')
 
-@fixture
-def set_repos_env(monkeypatch: MonkeyPatch, repos: List[Path]):
-    monkeypatch.setenv('TYPER_SCRIPTS_REPOS',
-                       ' '.join([str(repo) for repo in repos]))
-    yield
 
-
-@fixture
-def unset_repos_env(monkeypatch: MonkeyPatch, repos: List[Path]):
-    monkeypatch.delenv('TYPER_SCRIPTS_REPOS')
-    yield
+@fixture(scope='session')
+def expected_check_calls(expanded_repos: List[Path]) \
+        -> Dict[Path, Tuple[_Call, ...]]:
+    return {
+        repo: (
+            call(get_unsaved_changes_args(repo), RunMode.DEFAULT,
+                 capture_output=True),
+            call(get_unpushed_commits_args(repo), RunMode.DEFAULT,
+                 capture_output=True),
+        )
+        for repo in expanded_repos
+    }
 
 
 @fixture
-def set_dotfiles_env(monkeypatch: MonkeyPatch):
-    monkeypatch.setenv('DOTFILES_REPO', 'TEST_DOTFILES_REPO')
+def unset_repos_env(monkeypatch: MonkeyPatch):
+    monkeypatch.delenv('TYPER_SCRIPTS_REPOS', raising=False)
 
 
 @fixture
-def cli_runner() -> CliRunner:
-    return CliRunner()
+def unset_dotfiles_env(monkeypatch: MonkeyPatch):
+    monkeypatch.delenv('DOTFILES_REPO', raising=False)
 
 
 def assert_stdout(message: str, out: str):
     assert message in out
 
 
-def assert_repo_not_clean(repo: Path, out: str) -> None:
-    assert_stdout(f"Repository in {repo.expanduser()} was not clean", out)
+def assert_repo_not_clean(expanded_repo: Path, out: str) -> None:
+    assert_stdout(f"Repository in {expanded_repo} was not clean", out)
 
 
-def assert_repos_not_clean(repos: Iterable[Path], out: str)\
+def assert_repos_not_clean(expanded_repos: Iterable[Path], out: str)\
         -> None:
-    for repo in repos:
+    for repo in expanded_repos:
         assert_repo_not_clean(repo, out)
 
 
@@ -89,41 +118,59 @@ def assert_clean_message_shown(out: str) -> None:
     assert_stdout("Everything's clean!", out)
 
 
-def assert_repos_fetched(repos: Iterable[Path], run: Mock) -> None:
-    run.assert_has_calls([
+def assert_repos_fetched(expanded_repos: Iterable[Path], run: Mock) \
+        -> None:
+    assert get_call_counts(run.call_args_list) == get_call_counts(
         call(get_git_fetch_args(repo), RunMode.DEFAULT)
-        for repo in repos
-    ])
+        for repo in expanded_repos
+    )
 
 
-def get_dotfiles_prefix() -> List[str]:
-    return ['git', '--git-dir=TEST_DOTFILES_REPO']
+def get_call_counts(calls: Iterable[_Call]) -> Counter[Tuple[Any, ...]]:
+    """Count run() calls so they can be compared in any order."""
+    return Counter(
+        (tuple(c.args[0]), *c.args[1:], tuple(sorted(c.kwargs.items())))
+        for c in calls
+    )
 
 
-def get_fetch_dotfiles_args() -> List[str]:
-    return [*get_dotfiles_prefix(), 'fetch']
+def make_fork_with_feature_branch(tmp_path: Path) -> Path:
+    """Push `feature` to `origin` while it tracks `upstream/main`."""
+    upstream, origin, fork = (tmp_path / name
+                              for name in ('upstream', 'origin', 'fork'))
+    git('init', '--bare', '-b', 'main', upstream)
+    git('init', '--bare', '-b', 'main', origin)
+    git('clone', upstream, fork)
+    git('-C', fork, 'commit', '--allow-empty', '-m', 'Initial commit')
+    git('-C', fork, 'push', 'origin', 'main')
+    git('-C', fork, 'remote', 'add', 'upstream', upstream)
+    git('-C', fork, 'remote', 'set-url', 'origin', origin)
+    git('-C', fork, 'fetch', 'upstream')
+    git('-C', fork, 'checkout', '-b', 'feature', '--track', 'upstream/main')
+    git('-C', fork, 'commit', '--allow-empty', '-m', 'Add feature')
+    git('-C', fork, 'push', 'origin', 'feature')
+    return fork
 
 
-def get_git_fetch_args(repo: Path) -> List[Union[str, Path]]:
-    return ['git', '-C', repo.expanduser(), 'fetch']
+def git(*args: Union[str, Path]) -> None:
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=t@t',
+                    *args], check=True, capture_output=True)
 
 
-def get_command_prefix_for_unpushed_commits() -> List[str]:
-    return ['log', '--branches', '--not', '--remotes', '--oneline']
+def get_git_fetch_args(expanded_repo: Path) -> List[Union[str, Path]]:
+    return ['git', '-C', expanded_repo, 'fetch']
 
 
-def get_unpushed_commits_args(repo: Path) -> List[Union[str, Path]]:
-    return ['git', '-C', repo.expanduser(),
-            *get_command_prefix_for_unpushed_commits()]
+def get_unpushed_commits_args(expanded_repo: Path) \
+        -> List[Union[str, Path]]:
+    return ['git', '-C', expanded_repo, '--no-optional-locks',
+            *UNPUSHED_COMMITS_SUFFIX]
 
 
-def get_command_prefix_for_unsaved_changes() -> List[str]:
-    return ['status', '--ignore-submodules', '--porcelain']
-
-
-def get_unsaved_changes_args(repo: Path) -> List[Union[str, Path]]:
-    return ['git', '-C', repo.expanduser(),
-            *get_command_prefix_for_unsaved_changes()]
+def get_unsaved_changes_args(expanded_repo: Path) \
+        -> List[Union[str, Path]]:
+    return ['git', '-C', expanded_repo, '--no-optional-locks',
+            *UNSAVED_CHANGES_SUFFIX]
 
 
 class TestFetchDotfiles:
@@ -137,59 +184,46 @@ class TestFetchDotfiles:
         assert_stdout('Fetching dotfiles', capsys.readouterr().out)
 
     @staticmethod
-    @mark.usefixtures('set_dotfiles_env')
     def test_fetch_runs_fetch(run: Mock) -> None:
         fetch_dotfiles()
 
-        run.assert_called_once_with(get_fetch_dotfiles_args(), RunMode.DEFAULT)
-
+        run.assert_called_once_with(FETCH_DOTFILES_ARGS, RunMode.DEFAULT)
 
-@mark.usefixtures('set_dotfiles_env')
-class TestCheckDotfilesClean:
     @staticmethod
-    @mark.usefixtures('run')
-    def test_check_shows_checking_dotfiles_message(
-            capsys: CaptureFixture[str]
-    ) -> None:
-        check_dotfiles_clean()
+    @mark.usefixtures('unset_dotfiles_env')
+    def test_fetch_exits_without_dotfiles_repo(run: Mock) -> None:
+        with raises(SystemExit, match=NO_DOTFILES_PATTERN):
+            fetch_dotfiles()
+
+        run.assert_not_called()
 
-        assert_stdout('Checking dotfiles', capsys.readouterr().out)
 
+class TestCheckDotfilesClean:
     @staticmethod
-    def test_check_shows_not_clean_on_dotfiles_with_unsaved_changes(
+    def test_check_shows_checking_dotfiles_message(
             run: Mock, capsys: CaptureFixture[str],
-            unsaved_changes_output: CompletedProcess[bytes]
+            clean_output: CompletedProcess[bytes],
     ) -> None:
-        run.side_effect = [unsaved_changes_output]
+        run.return_value = clean_output
 
         check_dotfiles_clean()
 
-        run.assert_called_once_with(
-            [*get_dotfiles_prefix(),
-             *get_command_prefix_for_unsaved_changes()],
-            RunMode.DEFAULT,
-            capture_output=True,
-        )
-        assert_stdout('Dotfiles were not clean', capsys.readouterr().out)
+        assert_stdout('Checking dotfiles', capsys.readouterr().out)
 
     @staticmethod
-    def test_check_shows_not_clean_on_dotfiles_with_unpushed_commits(
-        run: Mock, capsys: CaptureFixture[str],
-        clean_output: CompletedProcess[bytes],
-        unpushed_commits_output: CompletedProcess[bytes]
+    @mark.parametrize('output_names', NOT_CLEAN_OUTPUTS,
+                      ids=NOT_CLEAN_OUTPUTS_IDS)
+    def test_check_shows_not_clean_on_dirty_dotfiles(
+        output_names: List[str], request: FixtureRequest, run: Mock,
+        capsys: CaptureFixture[str],
     ) -> None:
-        run.side_effect = [clean_output, unpushed_commits_output]
+        run.side_effect = [request.getfixturevalue(name)
+                           for name in output_names]
 
         check_dotfiles_clean()
 
-        run.assert_has_calls([
-            call([*get_dotfiles_prefix(),
-                  *get_command_prefix_for_unsaved_changes()],
-                 RunMode.DEFAULT, capture_output=True),
-            call([*get_dotfiles_prefix(),
-                  *get_command_prefix_for_unpushed_commits()],
-                 RunMode.DEFAULT, capture_output=True),
-        ])
+        assert run.call_args_list \
+            == DOTFILES_CHECK_CALLS[:len(output_names)]
         assert_stdout('Dotfiles were not clean', capsys.readouterr().out)
 
     @staticmethod
@@ -197,18 +231,11 @@ class TestCheckDotfilesClean:
         run: Mock, capsys: CaptureFixture[str],
         clean_output: CompletedProcess[bytes],
     ) -> None:
-        run.side_effect = [clean_output] * 2
+        run.return_value = clean_output
 
         check_dotfiles_clean()
 
-        run.assert_has_calls([
-            call([*get_dotfiles_prefix(),
-                  *get_command_prefix_for_unsaved_changes()],
-                 RunMode.DEFAULT, capture_output=True),
-            call([*get_dotfiles_prefix(),
-                  *get_command_prefix_for_unpushed_commits()],
-                 RunMode.DEFAULT, capture_output=True),
-        ])
+        assert run.call_args_list == DOTFILES_CHECK_CALLS
         assert_stdout('Dotfiles were clean!', capsys.readouterr().out)
 
 
@@ -223,138 +250,223 @@ class TestFetchRepos:
         assert_stdout('Fetching repos', capsys.readouterr().out)
 
     @staticmethod
-    def test_fetch_is_run_for_every_repo(run: Mock, repos: List[Path]) \
-            -> None:
+    def test_fetch_is_run_for_every_repo(
+            run: Mock, repos: List[Path], expanded_repos: List[Path],
+    ) -> None:
         fetch_repos(repos)
 
-        assert_repos_fetched(repos, run)
+        assert_repos_fetched(expanded_repos, run)
+
+    @staticmethod
+    def test_fetch_runs_at_most_jobs_repos_at_once(
+            run: Mock, repos: List[Path], expanded_repos: List[Path],
+    ) -> None:
+        with patch('typer_scripts.repos.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as executor:
+            fetch_repos(repos, 2)
+
+        executor.assert_called_once_with(2)
+        assert_repos_fetched(expanded_repos, run)
+
+    @staticmethod
+    @mark.usefixtures('run')
+    def test_fetch_runs_one_repo_at_a_time_by_default(
+            repos: List[Path],
+    ) -> None:
+        with patch('typer_scripts.repos.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as executor:
+            fetch_repos(repos)
+
+        executor.assert_called_once_with(1)
+
+    @staticmethod
+    def test_fetch_prints_dry_run_in_repo_order(
+            capsys: CaptureFixture[str],
+    ) -> None:
+        repos = [Path(f'/repo{i}') for i in range(10)]
+
+        with patch('typer_scripts.repos.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as executor:
+            fetch_repos(repos, 8, mode=RunMode.DRY_RUN)
+
+        executor.assert_called_once_with(1)
+        out = capsys.readouterr().out
+        printed_commands = [line for line in out.splitlines()
+                            if line.startswith('(')]
+        assert printed_commands \
+            == [str(tuple(get_git_fetch_args(repo))) for repo in repos]
 
     @staticmethod
-    @mark.usefixtures('set_repos_env')
-    def test_fetch_uses_env_as_default(run: Mock, repos: List[Path],
-                                       monkeypatch: MonkeyPatch) \
+    def test_fetch_uses_env_as_default(run: Mock, expanded_repos: List[Path]) \
             -> None:
         fetch_repos()
 
-        assert_repos_fetched(repos, run)
+        assert_repos_fetched(expanded_repos, run)
+
+    @staticmethod
+    def test_fetch_splits_env_like_a_shell(
+            run: Mock, monkeypatch: MonkeyPatch, expanded_repo1: Path,
+    ) -> None:
+        monkeypatch.setenv('TYPER_SCRIPTS_REPOS', "~/repo1  '~/my repo'")
+
+        fetch_repos()
+
+        assert_repos_fetched([expanded_repo1, HOME / 'my repo'], run)
 
     @staticmethod
     @mark.usefixtures('unset_repos_env')
     @mark.parametrize('args', [(), (None,), (list())])
     def test_fetch_exits_without_repos(args: Tuple[Any, ...], run: Mock) \
             -> None:
-        message = ('Either the `repos` argument or the `TYPER_SCRIPTS_REPOS` '
-                   'env variable must be provided')
-
-        with raises(SystemExit, match=message):
+        with raises(SystemExit, match=NO_REPOS_PATTERN):
             fetch_repos(*args)
 
 
 class TestCheckReposClean:
     @staticmethod
     def test_check_says_clean_on_clean_repos(
-        run: Mock, repos: List[Path], capsys: CaptureFixture[str],
-        clean_output: CompletedProcess[bytes]
+        run: Mock, repos: List[Path], expanded_repos: List[Path],
+        capsys: CaptureFixture[str], clean_output: CompletedProcess[bytes],
+        expected_check_calls: Dict[Path, Tuple[_Call, ...]],
     ) -> None:
-        run.side_effect = [clean_output for _ in range(len(repos) * 2)]
+        run.side_effect = repeat(clean_output)
 
         check_repos_clean(repos)
 
-        for repo in repos:
-            run.assert_has_calls([
-                call(get_unsaved_changes_args(repo), RunMode.DEFAULT,
-                     capture_output=True),
-                call(get_unpushed_commits_args(repo), RunMode.DEFAULT,
-                     capture_output=True),
-            ])
+        assert get_call_counts(run.call_args_list) == get_call_counts(
+            check_call for repo in expanded_repos
+            for check_call in expected_check_calls[repo]
+        )
         assert_clean_message_shown(capsys.readouterr().out)
 
     @staticmethod
-    def test_check_says_not_clean_on_repos_with_unsaved_changes(
-        run: Mock, repo1: Path, capsys: CaptureFixture[str],
-        unsaved_changes_output: CompletedProcess[bytes]
+    @mark.slow
+    def test_check_says_clean_on_branch_pushed_to_another_remote(
+            tmp_path: Path, capsys: CaptureFixture[str],
     ) -> None:
-        run.side_effect = [unsaved_changes_output]
+        fork = make_fork_with_feature_branch(tmp_path)
 
-        check_repos_clean([repo1])
+        check_repos_clean([fork])
 
-        run.assert_called_once_with(
-            get_unsaved_changes_args(repo1), RunMode.DEFAULT,
-            capture_output=True,
-        )
-        assert_repo_not_clean(repo1, capsys.readouterr().out)
+        assert_clean_message_shown(capsys.readouterr().out)
 
     @staticmethod
-    def test_check_says_not_clean_on_repos_with_unpushed_commits(
-        run: Mock, repo1: Path, capsys: CaptureFixture[str],
+    def test_check_runs_at_most_jobs_repos_at_once(
+        run: Mock, repos: List[Path], expanded_repos: List[Path],
         clean_output: CompletedProcess[bytes],
-        unpushed_commits_output: CompletedProcess[bytes],
+        expected_check_calls: Dict[Path, Tuple[_Call, ...]],
     ) -> None:
-        run.side_effect = [clean_output, unpushed_commits_output]
+        run.side_effect = repeat(clean_output)
+
+        with patch('typer_scripts.repos.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as executor:
+            check_repos_clean(repos, 1)
+
+        executor.assert_called_once_with(1)
+        assert run.call_args_list == [
+            check_call for repo in expanded_repos
+            for check_call in expected_check_calls[repo]
+        ]
+
+    @staticmethod
+    @mark.parametrize('output_names', NOT_CLEAN_OUTPUTS,
+                      ids=NOT_CLEAN_OUTPUTS_IDS)
+    def test_check_says_not_clean_on_dirty_repos(
+        output_names: List[str], request: FixtureRequest, run: Mock,
+        repo1: Path, expanded_repo1: Path, capsys: CaptureFixture[str],
+        expected_check_calls: Dict[Path, Tuple[_Call, ...]],
+    ) -> None:
+        run.side_effect = [request.getfixturevalue(name)
+                           for name in output_names]
 
         check_repos_clean([repo1])
 
-        run.assert_has_calls([
-            call(get_unsaved_changes_args(repo1), RunMode.DEFAULT,
-                 capture_output=True),
-            call(get_unpushed_commits_args(repo1), RunMode.DEFAULT,
-                 capture_output=True),
-        ])
-        assert_repo_not_clean(repo1, capsys.readouterr().out)
+        assert run.call_args_list \
+            == list(expected_check_calls[expanded_repo1][:len(output_names)])
+        assert_repo_not_clean(expanded_repo1, capsys.readouterr().out)
 
     @staticmethod
     def test_check_exits_with_not_a_repo_error_on_invalid_repo(
-        run: Mock, repo1: Path,
+        run: Mock, repo1: Path, expanded_repo1: Path,
+        not_a_repo_pattern: Pattern[str],
     ) -> None:
         run.side_effect = CalledProcessError(128, 'command')
 
-        with raises(SystemExit,
-                    match=f'Not a git repository: {repo1.expanduser()}'):
+        with raises(SystemExit, match=not_a_repo_pattern):
             check_repos_clean([repo1])
 
         run.assert_called_once_with(
-            get_unsaved_changes_args(repo1), RunMode.DEFAULT,
+            get_unsaved_changes_args(expanded_repo1), RunMode.DEFAULT,
             capture_output=True,
         )
 
     @staticmethod
-    def test_check_reraises_unhandled_error(run: Mock, repo1: Path) -> None:
+    def test_check_reraises_unhandled_error(
+        run: Mock, repo1: Path, expanded_repo1: Path,
+    ) -> None:
         exception = CalledProcessError(1, 'command')
         run.side_effect = exception
-        message = "Command 'command' returned non-zero exit status 1."
-
-        with raises(CalledProcessError, match=message):
+        with raises(CalledProcessError, match=NON_ZERO_EXIT_PATTERN):
             check_repos_clean([repo1])
 
         run.assert_called_once_with(
-            get_unsaved_changes_args(repo1), RunMode.DEFAULT,
-            capture_output=True
+            get_unsaved_changes_args(expanded_repo1), RunMode.DEFAULT,
+            capture_output=True,
         )
 
     @staticmethod
-    @mark.usefixtures('set_repos_env')
+    def test_check_warns_about_earlier_repos_before_a_later_error(
+        run: Mock, repos: List[Path], expanded_repo1: Path,
+        capsys: CaptureFixture[str],
+        unsaved_changes_output: CompletedProcess[bytes],
+    ) -> None:
+        def git(args: List[Union[str, Path]], *_: Any, **__: Any) \
+                -> CompletedProcess[bytes]:
+            if args[2] == expanded_repo1:
+                return unsaved_changes_output
+            raise CalledProcessError(1, 'command')
+        run.side_effect = git
+
+        with raises(CalledProcessError, match=NON_ZERO_EXIT_PATTERN):
+            check_repos_clean(repos)
+
+        assert_repo_not_clean(expanded_repo1, capsys.readouterr().out)
+
+    @staticmethod
     def test_check_uses_env_as_default(
-        run: Mock, repos: List[Path], capsys: CaptureFixture[str],
+        run: Mock, expanded_repos: List[Path], capsys: CaptureFixture[str],
         unsaved_changes_output: CompletedProcess[bytes]
     ) -> None:
         run.return_value = unsaved_changes_output
 
         check_repos_clean()
 
-        assert_repos_not_clean(repos, capsys.readouterr().out)
+        assert_repos_not_clean(expanded_repos, capsys.readouterr().out)
 
 
+@mark.integration
 class TestApp:
     @staticmethod
-    @mark.usefixtures('set_repos_env', 'set_dotfiles_env')
-    def test_main_dry_run_prints_expected_output_and_exits(
-            cli_runner: CliRunner, repos: List[Path],
+    @fixture(scope='session')
+    def dry_run_result(cli_runner: CliRunner) -> Result:
+        return cli_runner.invoke(app, '--dry-run', catch_exceptions=False)
+
+    @staticmethod
+    def test_main_dry_run_prints_dotfiles_commands(
+            dry_run_result: Result,
     ) -> None:
-        result = cli_runner.invoke(app, '--dry-run', catch_exceptions=False)
-
-        assert str(tuple(get_fetch_dotfiles_args())) in result.stdout
-        assert 'function:check_dotfiles_clean' in result.stdout
-        for repo in repos:
-            assert str(tuple(get_git_fetch_args(repo))) in result.stdout
-        assert 'function:check_repos_clean' in result.stdout
-        assert result.exit_code == 0
+        assert str(tuple(FETCH_DOTFILES_ARGS)) in dry_run_result.stdout
+        assert 'function:check_dotfiles_clean' in dry_run_result.stdout
+
+    @staticmethod
+    def test_main_dry_run_prints_repos_commands(
+            dry_run_result: Result, expanded_repos: List[Path],
+    ) -> None:
+        for repo in expanded_repos:
+            assert str(tuple(get_git_fetch_args(repo))) \
+                in dry_run_result.stdout
+        assert 'function:check_repos_clean' in dry_run_result.stdout
+
+    @staticmethod
+    def test_main_dry_run_exits_successfully(dry_run_result: Result) -> None:
+        assert dry_run_result.exit_code == 0
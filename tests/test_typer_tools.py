@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from pytest import fixture, CaptureFixture, raises
+from pytest import fixture, mark, CaptureFixture, raises
 from typer import Option
 from typer.testing import CliRunner
 
@@ -7,64 +7,36 @@ from typer_scripts.core import CoreException
 from typer_scripts.typer_tools import App
 
 
-@fixture
-def cli_runner() -> CliRunner:
-    return CliRunner(mix_stderr=False)
-
-
 class TestApp:
     @staticmethod
-    def test_callback_catches_core_exception(capsys: CaptureFixture[str]):
-        app_ = App()
-
-        @app_.callback()
-        def callback() -> None:
-            raise CoreException('message')
-
-        callback()
-
-        assert 'message\n' == capsys.readouterr().err
+    @fixture
+    def app() -> App:
+        return App()
 
     @staticmethod
-    def test_callback_prints_message_for_unhandled_errors(
-            capsys: CaptureFixture[str],
+    @mark.parametrize('register', ['callback', 'command'])
+    def test_registered_function_catches_core_exception(
+            app: App, capsys: CaptureFixture[str], register: str,
     ):
-        app_ = App()
-
-        @app_.callback()
-        def callback() -> None:
-            raise Exception('message')
-
-        with raises(Exception):
-            callback()
-
-        assert 'Unhandled error, printing traceback:\n' \
-            == capsys.readouterr().err
-
-    @staticmethod
-    def test_command_catches_core_exception(capsys: CaptureFixture[str]):
-        app_ = App()
-
-        @app_.command()
-        def command() -> None:
+        @getattr(app, register)()
+        def f() -> None:
             raise CoreException('message')
 
-        command()
+        f()
 
         assert 'message\n' == capsys.readouterr().err
 
     @staticmethod
-    def test_command_prints_message_for_unhandled_errors(
-            capsys: CaptureFixture[str],
+    @mark.parametrize('register', ['callback', 'command'])
+    def test_registered_function_prints_message_for_unhandled_errors(
+            app: App, capsys: CaptureFixture[str], register: str,
     ):
-        app_ = App()
-
-        @app_.command()
-        def command() -> None:
+        @getattr(app, register)()
+        def f() -> None:
             raise Exception('message')
 
         with raises(Exception):
-            command()
+            f()
 
         assert 'Unhandled error, printing traceback:\n' \
             == capsys.readouterr().err
@@ -121,13 +93,14 @@ class TestTyperWithOptionDefault:
         assert callback_default in capsys.readouterr().out
 
     @staticmethod
-    def test_callback_gets_keyword_value_when_invoked_with_typer(
-            app: App, cli_runner: CliRunner,
+    def test_callback_gets_keyword_value_when_invoked_as_function(
+            app: App, capsys: CaptureFixture[str],
     ) -> None:
-        result = cli_runner.invoke(app, ['--message', 'kwarg'],
-                                   catch_exceptions=False)
+        f = app.registered_callback.callback  # type: ignore[union-attr]
+
+        f(message='kwarg')  # type:ignore[misc]
 
-        assert 'kwarg' in result.stdout
+        assert 'kwarg' in capsys.readouterr().out
 
     @staticmethod
     def test_callback_gets_positional_value_when_invoked_as_function(
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
+import shutil
 import subprocess
 import sys
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Any, Callable, List, Union, TypeVar, cast
+from typing import Any, Callable, List, Optional, Union, TypeVar, cast
 
 from domestobot import dry_run_option
 from typer import style
@@ -23,11 +24,13 @@ class RunMode(str, Enum):
 
 
 def task_title(message: str) -> Callable[[FunctionType], FunctionType]:
+    dotted_message = _dot(message)
+
     def decorator(f: FunctionType) -> FunctionType:
 
         @wraps(f)
         def wrapper(*args: ArgsType, **kwargs: KwargsType) -> ReturnType:
-            title(message)
+            _print_title(dotted_message)
             return f(*args, **kwargs)
 
         return cast(FunctionType, wrapper)
@@ -35,7 +38,14 @@ def task_title(message: str) -> Callable[[FunctionType], FunctionType]:
 
 
 def title(message: str) -> None:
-    dotted_message = f'\n{message}...'
+    _print_title(_dot(message))
+
+
+def _dot(message: str) -> str:
+    return f'\n{message}...'
+
+
+def _print_title(dotted_message: str) -> None:
     print(_colorize(dotted_message, 'magenta', bold=True))
 
 
@@ -48,6 +58,8 @@ def warning(message: str) -> None:
 
 
 def _colorize(message: str, foreground: str, **kwargs: Any) -> str:
+    if sys.stdout is None or not sys.stdout.isatty():
+        return message
     return style(message, foreground, **kwargs)
 
 
@@ -55,18 +67,32 @@ def run(args: List[Union[str, Path]], mode: RunMode,
         capture_output: bool = False) -> CompletedProcess[bytes]:
     if mode is RunMode.DRY_RUN:
         dry_run_args = tuple(args)
-        print(dry_run_args)
-        return CompletedProcess(dry_run_args, 0, str(dry_run_args).encode())
+        printed_args = str(dry_run_args)
+        print(printed_args)
+        return CompletedProcess(dry_run_args, 0, printed_args.encode())
+    elif capture_output:
+        return subprocess.run(args, check=True, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL,
+                              executable=_which(args[0]), close_fds=False)
     else:
-        return subprocess.run(args, check=True, capture_output=capture_output)
+        return subprocess.run(args, check=True,
+                              executable=_which(args[0]), close_fds=False)
+
+
+@lru_cache(maxsize=None)
+def _which(command: Union[str, Path]) -> Optional[str]:
+    """Resolve `command` to a path so subprocess can use posix_spawn."""
+    return shutil.which(command)
 
 
 def dry_run_repr(f: StatementType) -> StatementType:
+    function_repr = f'function:{f.__name__}'  # type: ignore[attr-defined]
+
     @wraps(f)
     def wrapper(*args: ArgsType, mode: RunMode = dry_run_option,
                 **kwargs: KwargsType) -> None:
         if mode is RunMode.DRY_RUN:
-            print(f'function:{f.__name__}')  # type: ignore[attr-defined]
+            print(function_repr)
         else:
             f(*args, mode=mode, **kwargs)
     return cast(StatementType, wrapper)
@@ -7,10 +7,11 @@ from typer_scripts.repos import app as repos_app
 from typer_scripts.typer_tools import App
 
 CONFIG_APPLY = 'config-apply'
+ROOT_DIR = get_root_dir()
 
 
 def get_app(path: str) -> typer.Typer:
-    return get_domestobot_app(get_root_dir() / f'{path}.toml')
+    return get_domestobot_app(ROOT_DIR / f'{path}.toml')
 
 
 app = App()
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from subprocess import CalledProcessError, CompletedProcess
+from subprocess import CalledProcessError
 from sys import exit
-from typing import Union, List, Optional
+from typing import (Callable, Iterator, TypeVar, Tuple, Union, List,
+                    Optional, Sequence)
 
 from domestobot import get_commands_callbacks, dry_run_option
 from typer import Context, Option, Argument
@@ -12,8 +16,20 @@ from typer_scripts.core import (info, task_title, warning, run, RunMode,
                                 dry_run_repr)
 from typer_scripts.typer_tools import App
 
+ResultType = TypeVar('ResultType')
+
+MAX_WORKERS = 32
+NO_OPTIONAL_LOCKS = '--no-optional-locks'
+
 app = App()
 run_mode_option = Option(RunMode.DEFAULT, hidden=True)
+jobs_option = Option(MAX_WORKERS, '--jobs', '-j', min=1,
+                     help='Maximum number of repos to process at once.')
+fetch_jobs_option = Option(
+    1, '--jobs', '-j', min=1,
+    help='Number of repos to fetch at once. Concurrent fetches share the '
+         'terminal, so their output and credential prompts can interleave.',
+)
 
 
 @app.callback(invoke_without_command=True)
@@ -36,7 +52,7 @@ def fetch_dotfiles(mode: RunMode = run_mode_option) -> None:
 @dry_run_repr
 def check_dotfiles_clean(mode: RunMode = run_mode_option) -> None:
     """Check if dotfiles have unpublished work."""
-    command = _get_git_dotfiles_command()
+    command = (*_get_git_dotfiles_command(), NO_OPTIONAL_LOCKS)
     if (_has_unsaved_changes(*command, mode=RunMode.DEFAULT)
             or _has_unpushed_commits(*command, mode=RunMode.DEFAULT)):
         warning('Dotfiles were not clean')
@@ -47,53 +63,78 @@ def check_dotfiles_clean(mode: RunMode = run_mode_option) -> None:
 @app.command()
 @task_title('Fetching repos')
 def fetch_repos(repos: Optional[List[Path]] = Argument(None),
+                jobs: int = fetch_jobs_option,
                 mode: RunMode = run_mode_option) \
         -> None:
     """Fetch new changes for repos."""
     sanitized_repos = sanitize_repos(repos)
-    for repo in sanitized_repos:
-        run(['git', '-C', repo, 'fetch'], mode)
+    # A dry run prints the plan, which should keep the repos' order
+    jobs = jobs if mode is RunMode.DEFAULT else 1
+    list(_map_repos(lambda repo: run(['git', '-C', repo, 'fetch'], mode),
+                    sanitized_repos, jobs))
 
 
 @app.command()
 @task_title('Checking git repos')
 @dry_run_repr
 def check_repos_clean(repos: Optional[List[Path]] = Argument(None),
+                      jobs: int = jobs_option,
                       mode: RunMode = run_mode_option) -> None:
     """Check if repos have unpublished work."""
     sanitized_repos = sanitize_repos(repos)
-    if dirty_repos := [repo for repo in sanitized_repos
-                       if is_tree_dirty(repo, RunMode.DEFAULT)]:
-        for repo in dirty_repos:
+    dirtiness = _map_repos(lambda repo: is_tree_dirty(repo, RunMode.DEFAULT),
+                           sanitized_repos, jobs)
+    all_clean = True
+    for repo, is_dirty in zip(sanitized_repos, dirtiness):
+        if is_dirty:
             warning(f"Repository in {repo} was not clean")
-    else:
+            all_clean = False
+    if all_clean:
         info("Everything's clean!")
 
 
-def _get_git_dotfiles_command() -> List[str]:
-    return ['git', f'--git-dir={os.getenv("DOTFILES_REPO")}']
+def _map_repos(f: Callable[[Path], ResultType], repos: List[Path],
+               jobs: int) -> Iterator[ResultType]:
+    """Call `f` on up to `jobs` repos at once, yielding results in order."""
+    with ThreadPoolExecutor(min(jobs, len(repos) or 1)) as executor:
+        yield from executor.map(f, repos)
+
+
+def _get_git_dotfiles_command() -> Tuple[str, ...]:
+    try:
+        dotfiles_repo = os.environ['DOTFILES_REPO']
+    except KeyError as e:
+        raise SystemExit('The `DOTFILES_REPO` env variable must be '
+                         'provided') from e
+    return 'git', f'--git-dir={dotfiles_repo}'
 
 
 def sanitize_repos(repos_param: Optional[List[Path]]) -> List[Path]:
-    user_repos: List[Path] = (repos_param if repos_param
-                              else _read_repos_env())
+    user_repos: Sequence[Path] = (repos_param if repos_param
+                                  else _read_repos_env())
     return [path.expanduser() for path in user_repos]
 
 
-def _read_repos_env() -> List[Path]:
+def _read_repos_env() -> Tuple[Path, ...]:
     try:
         env_repos = os.environ['TYPER_SCRIPTS_REPOS']
     except KeyError as e:
         message = ('Either the `repos` argument or the `TYPER_SCRIPTS_REPOS` '
                    'env variable must be provided')
         raise SystemExit(message) from e
-    return [Path(path) for path in env_repos.split(' ')]
+    return _parse_repos(env_repos)
+
+
+@lru_cache(maxsize=1)
+def _parse_repos(env_repos: str) -> Tuple[Path, ...]:
+    return tuple(Path(path) for path in shlex.split(env_repos))
 
 
 def is_tree_dirty(dir_: Path, mode: RunMode) -> bool:
+    command = ('git', '-C', dir_, NO_OPTIONAL_LOCKS)
     try:
-        is_dirty = (_has_unsaved_changes('git', '-C', dir_, mode=mode)
-                    or _has_unpushed_commits('git', '-C', dir_, mode=mode))
+        is_dirty = (_has_unsaved_changes(*command, mode=mode)
+                    or _has_unpushed_commits(*command, mode=mode))
     except CalledProcessError as e:
         if e.returncode == 128:
             exit(f'Not a git repository: {dir_}')
@@ -105,23 +146,19 @@ def is_tree_dirty(dir_: Path, mode: RunMode) -> bool:
 def _has_unsaved_changes(*command_prefix: Union[str, Path], mode: RunMode) \
         -> bool:
     unsaved_changes = run(
-        [*command_prefix, 'status', '--ignore-submodules', '--porcelain'],
+        [*command_prefix, 'status', '--porcelain', '--ignore-submodules'],
         RunMode.DEFAULT,
         capture_output=True,
     )
-    return bool(_decode_stripped(unsaved_changes))
+    return bool(unsaved_changes.stdout)
 
 
 def _has_unpushed_commits(*command_prefix: Union[str, Path], mode: RunMode) \
         -> bool:
     unpushed_commits = run(
-        [*command_prefix, 'log', '--branches', '--not', '--remotes',
-         '--oneline'],
+        [*command_prefix, 'rev-list', '-1', '--branches', '--not',
+         '--remotes'],
         RunMode.DEFAULT,
         capture_output=True,
     )
-    return bool(_decode_stripped(unpushed_commits))
-
-
-def _decode_stripped(command_output: CompletedProcess[bytes]) -> str:
-    return command_output.stdout.decode('utf-8').strip()
+    return bool(unpushed_commits.stdout)
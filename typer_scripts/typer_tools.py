@@ -54,14 +54,13 @@ def _fix_defaults(f: CommandFunctionType) -> CommandFunctionType:
         if (sig_default := sig_param.default) is not Parameter.empty
     }
 
+    param_names = tuple(sig.parameters)
+
     @wraps(f)
     def wrapper(*args, **kwargs) -> Any:
-        passed_args_names = {name for name, _
-                             in zip(sig.parameters.keys(), args)}
-        passed_params = passed_args_names | kwargs.keys()
-        not_passed_params = sig.parameters.keys() - passed_params
         needed_defaults = {name: patched_defaults[name]
-                           for name in not_passed_params}
+                           for name in param_names[len(args):]
+                           if name not in kwargs}
         return f(*args, **kwargs, **needed_defaults)
 
     return cast(CommandFunctionType, wrapper)